@@ -16,6 +16,38 @@ __author__ = "Streamlink"
 __copyright__ = "Copyright 2024 Streamlink"
 __credits__ = ["https://github.com/streamlink/streamlink/blob/master/AUTHORS"]
 
-from streamlink.api import streams
-from streamlink.exceptions import StreamlinkError, PluginError, NoStreamsError, NoPluginError, StreamError
-from streamlink.session import Streamlink
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from streamlink.api import streams
+    from streamlink.exceptions import StreamlinkError, PluginError, NoStreamsError, NoPluginError, StreamError
+    from streamlink.session import Streamlink
+
+
+__all__ = (
+    "streams",
+    "Streamlink",
+    "StreamlinkError",
+    "PluginError",
+    "NoStreamsError",
+    "NoPluginError",
+    "StreamError",
+)
+
+_EXCEPTIONS = frozenset(("StreamlinkError", "PluginError", "NoStreamsError", "NoPluginError", "StreamError"))
+
+
+# resolve the public API lazily, so that importing the package (e.g. for reading its version) stays cheap
+def __getattr__(name: str):
+    if name == "Streamlink":
+        from streamlink.session import Streamlink
+        return Streamlink
+    if name == "streams":
+        from streamlink.api import streams
+        return streams
+    if name in _EXCEPTIONS:
+        import streamlink.exceptions
+        return getattr(streamlink.exceptions, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
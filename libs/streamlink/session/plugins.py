@@ -1,29 +1,114 @@
 from __future__ import annotations
 
 import logging
+import os
 import pkgutil
-from collections.abc import Iterator, Mapping
+import re
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from types import ModuleType
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
+from urllib.parse import urlsplit
 
 import streamlink.plugins
 from streamlink.options import Arguments
 
 # noinspection PyProtectedMember
 from streamlink.plugin.plugin import NO_PRIORITY, Matchers, Plugin
-from streamlink.utils.module import exec_module
+from streamlink.session.plugins_index import load_index, scan_plugin_modules
+from streamlink.utils.module import exec_module, get_finder
 
 
 if TYPE_CHECKING:
     from _typeshed.importlib import PathEntryFinderProtocol
 
+    # a (pattern.match, (name, plugin)) pair of a plugin's matcher
+    _MatcherEntry = tuple[Callable[[str], re.Match | None], tuple[str, "type[Plugin] | _LazyPlugin"]]
 
-log = logging.getLogger(".".join(__name__.split(".")[:-1]))
+
+# the logger is named literally instead of being derived from __name__ at import time
+log = logging.getLogger("streamlink.session")
 
 # The path to Streamlink's built-in plugins
 _PLUGINS_PATH = Path(streamlink.plugins.__path__[0])
 
+# Lookup order of specific plugins: the generic plugins need to come after the site-specific ones (sorting is stable,
+# so all other plugins keep their order in between), while youtv has to take precedence over the generic HLS plugin
+_LOOKUP_ORDER = {
+    "youtv": -3,
+    "hls": -2,
+    "dash": -1,
+    "http": 1,
+}
+
+# Inline flags which can be applied to a scoped group of the combined matcher pattern
+_SCOPED_FLAGS = (
+    (re.ASCII, "a"),
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+)
+_SUPPORTED_FLAGS = re.UNICODE | re.ASCII | re.IGNORECASE | re.MULTILINE | re.DOTALL | re.VERBOSE
+
+# Named group definitions and references, which need to be renamed when combining matcher patterns
+_RE_NAMED_GROUP = re.compile(r"(?<!\\)\(\?(P<|P=|\()(\w+)([>)])")
+# Numbered group references can't be rewritten reliably, as group numbers change when combining patterns
+_RE_NUMBERED_REF = re.compile(r"\\[1-9]|\(\?\(\d")
+
+# Literal host of a matcher pattern which is anchored to an HTTP(S) URL, e.g. "https?://(?:www\.)?example\.com/".
+# The host needs to be followed by a path or port separator which isn't made optional by a quantifier.
+_RE_LITERAL_HOST = re.compile(r"https\??://(?P<www>\(\?:www\\\.\)\?)?(?P<host>(?:[a-zA-Z0-9-]|\\[.-])+)[/:](?![?*+{])")
+
+
+def _literal_hosts(pattern: re.Pattern) -> tuple[str, ...] | None:
+    """Get the hosts which a URL needs to have for being matched by the pattern, or ``None`` if they are unknown"""
+
+    if not isinstance(pattern.pattern, str) or pattern.flags & (re.IGNORECASE | re.VERBOSE):
+        return None
+    # an alternation may continue with a different URL after the literal host, e.g. "https?://foo\.com/|https?://bar\.com/"
+    if "|" in pattern.pattern:
+        return None
+    if not (match := _RE_LITERAL_HOST.match(pattern.pattern)):
+        return None
+
+    host = match["host"].replace("\\", "")
+
+    return (host, f"www.{host}") if match["www"] else (host,)
+
+
+class _LazyPlugin:
+    """
+    Placeholder of a built-in plugin which was read from the plugins index and which hasn't been imported yet.
+    Its plugin class gets loaded when it's accessed by name or when it's resolved from a URL.
+    """
+
+    __slots__ = ("matchers", "arguments")
+
+    def __init__(self, matchers: Matchers, arguments: Arguments):
+        self.matchers = matchers
+        self.arguments = arguments
+
+
+class _MatcherLookup(NamedTuple):
+    """
+    The lookup data of :meth:`StreamlinkPlugins.match_url`, which gets built from the plugins as a whole and which gets replaced
+    as a whole, so that concurrent URL lookups never see a partially built state
+    """
+
+    # flat list of all (pattern.match, (name, plugin)) matchers in lookup order
+    matchers: list[_MatcherEntry]
+    # all matcher patterns combined into a single pattern, with a group name to (name, plugin) mapping
+    combined: re.Pattern | None
+    combined_groups: dict[str, tuple[str, type[Plugin] | _LazyPlugin]]
+    # matchers which can match a URL's host, and the ones which aren't bound to a specific host,
+    # used for filtering the matchers if the patterns can't be combined
+    host_matchers: dict[str, list[_MatcherEntry]]
+    generic_matchers: list[_MatcherEntry]
+
 
 class StreamlinkPlugins:
     """
@@ -33,22 +118,42 @@ class StreamlinkPlugins:
     """
 
     def __init__(self, builtin: bool = True):
-        self._plugins: dict[str, type[Plugin]] = {}
+        # loaded plugin classes and placeholders of not yet imported built-in plugins, in lookup order
+        self._plugins: dict[str, type[Plugin] | _LazyPlugin] = {}
+        # all (name, plugin) pairs of plugins which have matchers, in lookup order, lazily built
+        # (match_url() returns these pairs as they are, so they don't need to be re-created for each match)
+        self._plugins_with_matchers: list[tuple[str, type[Plugin] | _LazyPlugin]] | None = None
+        # lookup data of match_url(), lazily built
+        self._lookup: _MatcherLookup | None = None
+        # guards changes of the plugins and the lookup data, as URL lookups of concurrent threads may import lazy plugins
+        # (re-entrant, as loading a lazy plugin replaces its placeholder via __setitem__)
+        self._lock = threading.RLock()
 
         if builtin:
             self.load_builtin()
 
     def __getitem__(self, item: str) -> type[Plugin]:
         """Access a loaded plugin class by name"""
-        return self._plugins[item]
+        plugin = self._plugins[item]
+        if isinstance(plugin, _LazyPlugin):
+            loaded = self._load_lazy(item)
+            if loaded is None:
+                raise KeyError(item)
+            return loaded
+
+        return plugin
 
     def __setitem__(self, key: str, value: type[Plugin]) -> None:
         """Add/override a plugin class by name"""
-        self._plugins[key] = value
+        with self._lock:
+            self._plugins[key] = value
+            self._invalidate_caches()
 
     def __delitem__(self, key: str) -> None:
         """Remove a loaded plugin by name"""
-        self._plugins.pop(key, None)
+        with self._lock:
+            self._plugins.pop(key, None)
+            self._invalidate_caches()
 
     def __contains__(self, item: str) -> bool:
         """Check if a plugin is loaded"""
@@ -56,14 +161,34 @@ class StreamlinkPlugins:
 
     def get_names(self) -> list[str]:
         """Get a list of the names of all loaded plugins"""
-        return sorted(self._plugins.keys())
+        return sorted(self._plugins)
 
     def get_loaded(self) -> dict[str, type[Plugin]]:
-        """Get a mapping of all loaded plugins"""
-        return dict(self._plugins)
+        """Get a mapping of all loaded plugins, which imports the built-in plugins that haven't been imported yet"""
+        for name, plugin in list(self._plugins.items()):
+            if isinstance(plugin, _LazyPlugin):
+                self._load_lazy(name)
+
+        return dict(self._plugins)  # type: ignore[arg-type]
 
     def load_builtin(self) -> bool:
         """Load Streamlink's built-in plugins"""
+        # read the plugins index and defer importing the plugin modules until they are needed
+        if (index := load_index(plugins_path=_PLUGINS_PATH)) is not None:
+            with self._lock:
+                self._plugins.update(
+                    (name, _LazyPlugin(*data) if data is not None else _LazyPlugin(Matchers(), Arguments()))
+                    for name, data in index.items()
+                )
+                self._invalidate_caches()
+
+            # plugins without index data need to be imported right away, in place of their placeholders
+            for name, data in index.items():
+                if data is None:
+                    self._load_lazy(name)
+
+            return bool(index)
+
         return self.load_path(_PLUGINS_PATH)
 
     def load_path(self, path: str | Path) -> bool:
@@ -75,80 +200,203 @@ class StreamlinkPlugins:
 
     def update(self, plugins: Mapping[str, type[Plugin]]):
         """Add/override loaded plugins"""
-        self._plugins.update(plugins)
+        with self._lock:
+            self._plugins.update(plugins)
+            self._invalidate_caches()
 
     def clear(self):
         """Remove all loaded plugins from the session"""
-        self._plugins.clear()
+        with self._lock:
+            self._plugins.clear()
+            self._invalidate_caches()
 
     def iter_arguments(self) -> Iterator[tuple[str, Arguments]]:
         """Iterate through all plugins and their :class:`Arguments <streamlink.options.Arguments>`"""
-        yield from (
-            (name, plugin.arguments)
-            for name, plugin in self._plugins.items()
-            if plugin.arguments
-        )
+        for name, plugin in self._plugins.items():
+            if arguments := plugin.arguments:
+                yield name, arguments
 
     def iter_matchers(self) -> Iterator[tuple[str, Matchers]]:
         """Iterate through all plugins and their :class:`Matchers <streamlink.plugin.plugin.Matchers>`"""
-        yield from (
-            (name, plugin.matchers)
-            for name, plugin in self._plugins.items()
-            if plugin.matchers
-        )
+        for name, plugin in self._get_plugins_with_matchers():
+            yield name, plugin.matchers
+
+    def _invalidate_caches(self) -> None:
+        self._plugins_with_matchers = None
+        self._lookup = None
+
+    def _get_plugins_with_matchers(self) -> list[tuple[str, type[Plugin] | _LazyPlugin]]:
+        if (plugins := self._plugins_with_matchers) is None:
+            with self._lock:
+                if (plugins := self._plugins_with_matchers) is None:
+                    plugins = [(name, plugin) for name, plugin in self._plugins.items() if plugin.matchers]
+                    self._plugins_with_matchers = plugins
+        return plugins
 
     def match_url(self, url: str) -> tuple[str, type[Plugin]] | None:
         """Find a matching plugin by URL"""
 
-        for name, matchers in self.iter_matchers():
-            for matcher in matchers:
-                if matcher.pattern.match(url) is not None:
-                    log.debug(f"Plugin [{name}] found for: {url}")
-                    return name, self._plugins[name]
+        # only read from a single snapshot of the lookup data, which may get replaced by other threads in the meantime
+        if (lookup := self._lookup) is None:
+            with self._lock:
+                if (lookup := self._lookup) is None:
+                    lookup = self._lookup = self._build_lookup()
+
+        if lookup.combined is not None:
+            if (match := lookup.combined.match(url)) is None:
+                return None
+            return self._resolve_match(url, lookup.combined_groups[match.lastgroup])  # type: ignore[index]
+
+        try:
+            host = urlsplit(url).netloc.partition(":")[0]
+        except ValueError:
+            matchers = lookup.matchers
+        else:
+            matchers = lookup.host_matchers.get(host, lookup.generic_matchers)
+
+        for match_func, result in matchers:
+            if match_func(url) is not None:
+                return self._resolve_match(url, result)
 
         return None
 
+    def _resolve_match(self, url: str, result: tuple[str, type[Plugin] | _LazyPlugin]) -> tuple[str, type[Plugin]] | None:
+        name, plugin = result
+        if isinstance(plugin, _LazyPlugin):
+            if (loaded := self._load_lazy(name)) is None:
+                # the plugin has been removed, so try again with the remaining plugins
+                return self.match_url(url)
+            result = name, loaded
+
+        log.debug(f"Plugin [{name}] found for: {url}")
+        return result  # type: ignore[return-value]
+
+    def _load_lazy(self, name: str) -> type[Plugin] | None:
+        # only import the plugin module once, even if concurrent URL lookups resolve the same placeholder
+        with self._lock:
+            plugin = self._plugins.get(name)
+            if not isinstance(plugin, _LazyPlugin):
+                # the plugin has been loaded or removed by another thread in the meantime
+                return plugin
+
+            lookup = self._load_plugin_from_finder(name, finder=get_finder(_PLUGINS_PATH))
+            if lookup is None:
+                log.error(f"Failed to load indexed plugin {name}, the plugins index may be outdated")
+                del self[name]
+                return None
+
+            # replacing the placeholder keeps the plugin's position in the lookup order
+            self[name] = lookup[1]
+
+            return lookup[1]
+
+    def _build_lookup(self) -> _MatcherLookup:
+        # store the bound match methods, to avoid attribute lookups when trying each matcher
+        matchers = [
+            (matcher.pattern.match, result)
+            for result in self._get_plugins_with_matchers()
+            for matcher in result[1].matchers
+        ]
+        combined, combined_groups = self._compile_combined(matchers)
+        if combined is not None:
+            return _MatcherLookup(matchers, combined, combined_groups, {}, [])
+
+        return _MatcherLookup(matchers, None, {}, *self._build_host_matchers(matchers))
+
+    @staticmethod
+    def _build_host_matchers(matchers: list[_MatcherEntry]) -> tuple[dict[str, list[_MatcherEntry]], list[_MatcherEntry]]:
+        buckets: dict[str, list[int]] = {}
+        generic: list[int] = []
+        for idx, (match_func, _result) in enumerate(matchers):
+            hosts = _literal_hosts(match_func.__self__)  # type: ignore[attr-defined]
+            if hosts is None:
+                generic.append(idx)
+            else:
+                for host in hosts:
+                    buckets.setdefault(host, []).append(idx)
+
+        # merge each host's matchers with the generic ones, keeping the lookup order of the matchers
+        host_matchers = {
+            host: [matchers[idx] for idx in sorted(indexes + generic)]
+            for host, indexes in buckets.items()
+        }
+
+        return host_matchers, [matchers[idx] for idx in generic]
+
+    @staticmethod
+    def _compile_combined(
+        matchers: list[_MatcherEntry],
+    ) -> tuple[re.Pattern | None, dict[str, tuple[str, type[Plugin] | _LazyPlugin]]]:
+        """
+        Combine all matcher patterns into a single alternation of named groups, so that a URL can be resolved
+        by a single call into the regex engine. The alternatives keep the order of the matchers, so the first
+        matching pattern still wins. Returns ``None`` and no groups if any pattern can't be combined.
+        """
+
+        if not matchers:
+            return None, {}
+
+        groups: dict[str, tuple[str, type[Plugin] | _LazyPlugin]] = {}
+        alternatives = []
+        for idx, (match_func, result) in enumerate(matchers):
+            pattern: re.Pattern = match_func.__self__  # type: ignore[attr-defined]
+            source = pattern.pattern
+            if (
+                not isinstance(source, str)
+                or pattern.flags & ~_SUPPORTED_FLAGS
+                or _RE_NUMBERED_REF.search(source)
+            ):
+                return None, {}
+
+            gname = f"_m{idx}"
+            # prefix inner named groups and their references, so that they don't collide with other patterns
+            source = _RE_NAMED_GROUP.sub(rf"(?\g<1>{gname}_\g<2>\g<3>", source)
+            flags = "".join(flag for value, flag in _SCOPED_FLAGS if pattern.flags & value)
+            if pattern.flags & re.VERBOSE:
+                # terminate trailing comments of verbose patterns
+                source = f"{source}\n"
+            alternatives.append(f"(?P<{gname}>(?{flags}:{source}))" if flags else f"(?P<{gname}>{source})")
+            groups[gname] = result
+
+        try:
+            return re.compile("|".join(alternatives)), groups
+        except re.error as err:
+            log.debug(f"Failed to combine plugin matchers: {err}")
+            return None, {}
+
     def _load_from_path(self, path: str | Path) -> dict[str, type[Plugin]]:
         plugins: dict[str, type[Plugin]] = {}
 
-        tDash = {}
-        tHls = {}
-        tHttp = {}
-        tYouTV = {}
-
-        for finder, name, _ in pkgutil.iter_modules([str(path)]):
-            lookup = self._load_plugin_from_finder(name, finder=finder)  # type: ignore[arg-type]
+        if Path(path).resolve() == _PLUGINS_PATH.resolve():
+            # built-in plugins are flat Python modules, so a single directory scan is enough for finding them
+            try:
+                names = [name for name, _filename in scan_plugin_modules(path)]
+            except OSError:
+                return plugins
+
+            # built-in plugins don't import each other, so execute them concurrently and process the results in order
+            load = partial(self._load_plugin_from_finder, finder=get_finder(path))
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                lookups = list(zip(names, executor.map(load, names)))
+        else:
+            # sideloaded plugins may also be packages, and they may import each other, while exec_module() adds modules
+            # to sys.modules before executing them without holding the import lock, so load them one after another
+            lookups = [
+                (name, self._load_plugin_from_finder(name, finder=finder))  # type: ignore[arg-type]
+                for finder, name, _ in pkgutil.iter_modules([str(path)])
+            ]
+
+        for name, lookup in lookups:
             if lookup is None:
                 continue
             mod, plugin = lookup
 
-            if name == 'dash':
-                tDash[name] = plugin
-            elif name == 'hls':
-                tHls[name] = plugin
-            elif name == 'http':
-                tHttp[name] = plugin
-            elif name == 'youtv':
-                tYouTV[name] = plugin
-            else:
-                if name in plugins:
-                    log.info(f"Plugin {name} is being overridden by {mod.__file__}")
-                plugins[name] = plugin
-
-        if tHttp:
-            plugins.update(tHttp)
-        if tDash:
-            tDash.update(plugins)
-            plugins = tDash
-        if tHls:
-            tHls.update(plugins)
-            plugins = tHls
-        if tYouTV:
-            tYouTV.update(plugins)
-            plugins = tYouTV
+            if name in plugins:
+                log.info(f"Plugin {name} is being overridden by {mod.__file__}")
+            plugins[name] = plugin
 
         # order: [youtv, hls, dash, ..., http]
-        return plugins
+        return dict(sorted(plugins.items(), key=lambda item: _LOOKUP_ORDER.get(item[0], 0)))
 
     @staticmethod
     def _load_plugin_from_finder(name: str, finder: PathEntryFinderProtocol) -> tuple[ModuleType, type[Plugin]] | None:
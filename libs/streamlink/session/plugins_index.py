@@ -0,0 +1,220 @@
+"""
+Prebuilt index of Streamlink's built-in plugins.
+
+The index stores the matchers and arguments of all built-in plugins, so that a session can resolve URLs
+without having to import every plugin module first. It has to be regenerated whenever a built-in plugin
+gets added, removed or changed. The index stores the size and modification time of each plugin module, and it gets
+ignored when they don't match the modules of the plugins directory anymore, in which case all built-in plugins get
+imported instead. Building the index also writes the bytecode cache of the plugin modules, so that importing them
+doesn't require parsing their sources:
+
+    python -c "from streamlink.session.plugins_index import build_index; build_index()"
+
+Modification times don't survive checkouts and copies of the plugins directory, so the index needs to be built where
+the plugins get installed. The index also stores a hash of each plugin module's contents, which can be verified
+by builds or CI checks, without having to read the plugin modules on each session start:
+
+    python -c "from streamlink.session.plugins_index import check_index; assert check_index()"
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+import streamlink.plugins
+from streamlink.options import Argument, Arguments
+
+# noinspection PyProtectedMember
+from streamlink.plugin.plugin import _PLUGINARGUMENT_TYPE_REGISTRY, Matcher, Matchers, Plugin
+
+
+# the logger is named literally instead of being derived from __name__ at import time
+log = logging.getLogger("streamlink.session")
+
+# The path to the index of Streamlink's built-in plugins
+PLUGINS_INDEX_PATH = Path(streamlink.plugins.__path__[0]) / "_index.json"
+
+_INDEX_VERSION = 3
+
+
+def _scan_module_entries(path: str | Path) -> list[os.DirEntry]:
+    with os.scandir(path) as entries:
+        return sorted(
+            (
+                entry
+                for entry in entries
+                if (
+                    entry.name.endswith(".py")
+                    and entry.name != "__init__.py"
+                    and entry.name[:-3].isidentifier()
+                    and entry.is_file()
+                )
+            ),
+            key=lambda entry: entry.name,
+        )
+
+
+def scan_plugin_modules(path: str | Path) -> list[tuple[str, str]]:
+    """Find the names and file paths of the plugin modules in the given path, sorted by name"""
+
+    return [(entry.name[:-3], entry.path) for entry in _scan_module_entries(path)]
+
+
+def _stat_modules(path: str | Path) -> dict[str, list[int]]:
+    # only stat the modules, so that validating the index doesn't need to read them
+    return {
+        entry.name[:-3]: [(stat := entry.stat()).st_size, stat.st_mtime_ns]
+        for entry in _scan_module_entries(path)
+    }
+
+
+def _hash_modules(path: str | Path) -> dict[str, str]:
+    return {
+        name: hashlib.sha256(Path(filename).read_bytes()).hexdigest()
+        for name, filename in scan_plugin_modules(path)
+    }
+
+
+def dump_plugins(plugins: Mapping[str, type[Plugin]], path: str | Path) -> dict[str, Any]:
+    """
+    Serialize the matchers and arguments of the given plugins, keeping their lookup order,
+    and store the size, modification time and hash of the modules of the path.
+    Plugins with argument types which can't be serialized, e.g. parametrized ones, are stored without any data,
+    so that they always get imported when loading the index.
+    """
+
+    types = {id(func): name for name, func in _PLUGINARGUMENT_TYPE_REGISTRY.items()}
+
+    def is_serializable(plugin: type[Plugin]) -> bool:
+        return all(argument.type is None or id(argument.type) in types for argument in plugin.arguments)
+
+    def dump_argument(argument: Argument) -> dict[str, Any]:
+        return dict(
+            name=argument.name,
+            action=argument.action,
+            nargs=argument.nargs,
+            const=argument.const,
+            default=argument.default,
+            type=types.get(id(argument.type)),
+            choices=argument.choices,
+            required=argument.required,
+            help=argument.help,
+            metavar=argument.metavar,
+            dest=argument._dest,
+            requires=argument.requires,
+            prompt=argument.prompt,
+            sensitive=argument.sensitive,
+            argument_name=argument._argument_name,
+        )
+
+    return dict(
+        version=_INDEX_VERSION,
+        modules=_stat_modules(path),
+        hashes=_hash_modules(path),
+        plugins={
+            name: dict(
+                matchers=[
+                    dict(
+                        pattern=matcher.pattern.pattern,
+                        flags=matcher.pattern.flags,
+                        priority=matcher.priority,
+                        name=matcher.name,
+                    )
+                    for matcher in plugin.matchers
+                ],
+                arguments=[dump_argument(argument) for argument in plugin.arguments],
+            )
+            if is_serializable(plugin)
+            else None
+            for name, plugin in plugins.items()
+        },
+    )
+
+
+def load_index(
+    path: Path = PLUGINS_INDEX_PATH,
+    plugins_path: Path = PLUGINS_INDEX_PATH.parent,
+) -> dict[str, tuple[Matchers, Arguments] | None] | None:
+    """
+    Read the matchers and arguments of the indexed plugins, or ``None`` if the index is missing, invalid,
+    or if it doesn't match the plugin modules of the plugins path. Plugins which need to be imported are set to ``None``.
+    """
+
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data["version"] != _INDEX_VERSION:
+            raise ValueError(f"Unsupported version: {data['version']}")
+
+        if data["modules"] != _stat_modules(plugins_path):
+            log.debug(f"The plugins index {path} is outdated")
+            return None
+
+        plugins: dict[str, tuple[Matchers, Arguments] | None] = {}
+        for name, plugin in data["plugins"].items():
+            if plugin is None:
+                plugins[name] = None
+                continue
+            matchers = Matchers(*(
+                Matcher(
+                    pattern=re.compile(matcher["pattern"], matcher["flags"]),
+                    priority=matcher["priority"],
+                    name=matcher["name"],
+                )
+                for matcher in plugin["matchers"]
+            ))  # fmt: skip
+            arguments = Arguments(*(
+                Argument(**{
+                    **argument,
+                    "type": _PLUGINARGUMENT_TYPE_REGISTRY[argument["type"]] if argument["type"] else None,
+                })
+                for argument in plugin["arguments"]
+            ))  # fmt: skip
+            plugins[name] = matchers, arguments
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, TypeError, KeyError, re.error) as err:
+        log.warning(f"Failed to read the plugins index {path}: {err}")
+        return None
+
+    return plugins
+
+
+def check_index(path: Path = PLUGINS_INDEX_PATH, plugins_path: Path = PLUGINS_INDEX_PATH.parent) -> bool:
+    """Check whether the index was built from the current contents of the plugin modules of the plugins path"""
+
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return data["version"] == _INDEX_VERSION and data["hashes"] == _hash_modules(plugins_path)
+    except (OSError, ValueError, TypeError, KeyError):
+        return False
+
+
+def build_index(path: Path = PLUGINS_INDEX_PATH) -> None:
+    """Import all built-in plugins and write their index"""
+
+    from streamlink.session.plugins import _PLUGINS_PATH, StreamlinkPlugins
+
+    # noinspection PyProtectedMember
+    plugins = StreamlinkPlugins(builtin=False)._load_from_path(_PLUGINS_PATH)
+    path.write_text(json.dumps(dump_plugins(plugins, _PLUGINS_PATH), indent=2) + "\n", encoding="utf-8")
+    compile_plugins(_PLUGINS_PATH)
+
+
+def compile_plugins(path: Path) -> bool:
+    """
+    Write the bytecode cache of the plugin modules in the given path, for both the default and the ``-O`` optimization level.
+    Plugin modules are loaded by the :class:`SourceFileLoader <importlib.machinery.SourceFileLoader>` of their path's finder,
+    which reads the cache instead of compiling the module's source if the cache is up-to-date.
+    """
+
+    import compileall
+
+    return compileall.compile_dir(path, maxlevels=0, quiet=1, optimize=[0, 1])
+
@@ -20,7 +20,8 @@ from streamlink.utils.url import update_scheme
 
 # Ensure that the Logger class returned is Streamslink's for using the API (for backwards compatibility)
 logging.setLoggerClass(StreamlinkLogger)
-log = logging.getLogger(".".join(__name__.split(".")[:-1]))
+# the logger is named literally instead of being derived from __name__ at import time
+log = logging.getLogger("streamlink.session")
 
 
 class Streamlink:
@@ -24,7 +24,8 @@ from streamlink.utils.parse import parse_xml
 from streamlink.utils.times import now
 
 
-log = logging.getLogger(".".join(__name__.split(".")[:-1]))
+# the logger is named literally instead of being derived from __name__ at import time
+log = logging.getLogger("streamlink.stream.dash")
 
 
 class DASHStreamWriter(SegmentedStreamWriter[DASHSegment, Response]):
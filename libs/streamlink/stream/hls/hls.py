@@ -27,7 +27,8 @@ from streamlink.utils.formatter import Formatter
 from streamlink.utils.times import now
 
 
-log = logging.getLogger(".".join(__name__.split(".")[:-1]))
+# the logger is named literally instead of being derived from __name__ at import time
+log = logging.getLogger("streamlink.stream.hls")
 
 
 class ByteRangeOffset:
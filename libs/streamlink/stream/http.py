@@ -1,9 +1,20 @@
 from __future__ import annotations
 
+import copy
+import logging
+from typing import TYPE_CHECKING
+
 from streamlink.exceptions import StreamError
 from streamlink.session import Streamlink
 from streamlink.stream.stream import Stream
-from streamlink.stream.wrappers import StreamIOIterWrapper, StreamIOThreadWrapper
+from streamlink.stream.wrappers import StreamIOThreadWrapper, StreamIOWrapper
+
+
+if TYPE_CHECKING:
+    from requests import PreparedRequest
+
+
+log = logging.getLogger(__name__)
 
 
 class HTTPStream(Stream):
@@ -14,7 +25,10 @@ class HTTPStream(Stream):
     __shortname__ = "http"
 
     args: dict
-    """A dict of keyword arguments passed to :meth:`requests.Session.request`, such as method, headers, cookies, etc."""
+    """
+    A dict of keyword arguments passed to :meth:`requests.Session.request`, such as method, headers, cookies, etc.
+    It only contains valid request arguments, as it gets filtered when the stream is initialized.
+    """
 
     def __init__(
         self,
@@ -33,13 +47,36 @@ class HTTPStream(Stream):
         super().__init__(session)
         self.args = self.session.http.valid_request_args(**kwargs)
         self.args["url"] = url
+        self._prepared: PreparedRequest | None = None
+        self._prepared_state: tuple | None = None
         self.buffered = buffered
         self.fd = None
         self.res = None
         self.chunk_size = self.session.get_option("chunk-size")
 
+    def _prepared_request(self) -> PreparedRequest:
+        # the prepared request depends on the request arguments and on the session's params, headers and cookies,
+        # which can all be modified in place, so it gets compared with a copy of them
+        http = self.session.http
+        state = (
+            self.args,
+            http.params,
+            http.headers,
+            [(cookie.domain, cookie.path, cookie.name, cookie.value, cookie.secure, cookie.expires) for cookie in http.cookies],
+        )
+        if self._prepared is not None and self._prepared_state == state:
+            return self._prepared
+
+        prepared = http.prepare_new_request(**self.args)
+        try:
+            self._prepared, self._prepared_state = prepared, copy.deepcopy(state)
+        except (TypeError, copy.Error):
+            self._prepared = self._prepared_state = None
+
+        return prepared
+
     def __json__(self):  # noqa: PLW3201
-        req = self.session.http.prepare_new_request(**self.args)
+        req = self._prepared_request()
 
         return dict(
             type=self.shortname(),
@@ -56,14 +93,15 @@ class HTTPStream(Stream):
     def url(self) -> str:
         """
         The URL to the stream, prepared by :mod:`requests` with parameters read from :attr:`args`.
+        It gets cached until :attr:`args` or the session's params, headers or cookies change.
         """
 
-        return self.session.http.prepare_new_request(**self.args).url  # type: ignore[return-value]
+        return self._prepared_request().url  # type: ignore[return-value]
 
     def open(self):
         timeout_job = self.session.options.get("stream-timeout")
         timeout_con = self.session.options.get("http-timeout") or (10,20)
-        reqargs = self.session.http.valid_request_args(**self.args)
+        reqargs = dict(self.args)
         reqargs.setdefault("method", "GET")
 
         self.res = self.session.http.request(
@@ -73,13 +111,26 @@ class HTTPStream(Stream):
             **reqargs,
         )
 
-        self.fd = StreamIOIterWrapper(self.res.iter_content(self.chunk_size))
+        # read from the urllib3 response directly, instead of re-chunking the output of iter_content() in another buffer
+        self.res.raw.decode_content = True
+        self.fd = StreamIOWrapper(self.res.raw)
         if self.buffered:
             self.fd = StreamIOThreadWrapper(self.session, self.fd, timeout=timeout_job, chunk_size=self.chunk_size)
 
         return self.fd
 
     def close(self):
-        self.res.close()
-        self.fd.close()
+        res, fd = self.res, self.fd
+        self.res = self.fd = None
+
+        if res is not None:
+            try:
+                res.close()
+            except Exception:
+                log.debug("Failed to close the HTTP response", exc_info=True)
+        if fd is not None:
+            try:
+                fd.close()
+            except Exception:
+                log.debug("Failed to close the stream output", exc_info=True)
 
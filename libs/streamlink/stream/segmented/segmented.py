@@ -20,7 +20,8 @@ if TYPE_CHECKING:
         from typing_extensions import TypeAlias
 
 
-log = logging.getLogger(".".join(__name__.split(".")[:-1]))
+# the logger is named literally instead of being derived from __name__ at import time
+log = logging.getLogger("streamlink.stream.segmented")
 
 
 class AwaitableMixin: